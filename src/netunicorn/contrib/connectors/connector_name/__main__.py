@@ -1,6 +1,16 @@
 import os
-import uvicorn
 
-from .rest import app
+import uvicorn
 
-uvicorn.run(app, host=os.environ.get("UVICORN_HOST", "0.0.0.0"), port=int(os.environ.get("UVICORN_PORT", 8000)))
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+uvicorn.run(
+    # derive the import string from this package so renaming the template
+    # package keeps `python -m` working
+    f"{__package__}.rest:app",
+    host=os.environ.get("UVICORN_HOST", "0.0.0.0"),
+    port=int(os.environ.get("UVICORN_PORT", 8000)),
+    workers=int(os.environ.get("UVICORN_WORKERS", "1")),
+    loop="uvloop",
+    http="httptools",
+    access_log=log_level not in ("WARNING", "ERROR", "CRITICAL"),
+)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class AsyncBatcher(Generic[ItemT, ResultT]):
+    """
+    Collects items submitted within a small time window and flushes them
+    as a single bulk call to the backend.
+
+    `flush` receives the batched items and must return one result per item,
+    in the same order. Awaiters of `submit` receive their own result (or the
+    flush exception, if the bulk call failed).
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[ItemT]], Awaitable[list[ResultT]]],
+        max_wait_ms: int = 5,
+        max_size: int = 64,
+    ):
+        self._flush = flush
+        self._max_wait = max_wait_ms / 1000
+        self._max_size = max_size
+        self._pending: list[tuple[ItemT, asyncio.Future[ResultT]]] = []
+        self._timer: Optional[asyncio.Task[None]] = None
+
+    async def submit(self, item: ItemT) -> ResultT:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ResultT] = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self._max_size:
+            await self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.create_task(self._flush_later())
+        return await future
+
+    async def _flush_later(self) -> None:
+        try:
+            await asyncio.sleep(self._max_wait)
+        finally:
+            # clear before flushing so _flush_pending doesn't cancel this task
+            self._timer = None
+        await self._flush_pending()
+
+    async def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"flush returned {len(results)} results for {len(batch)} items"
+                )
+        except BaseException as e:
+            # fail every waiter (including on cancellation of the flush) so
+            # nobody is left awaiting an unresolved future forever
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
+import time
+from collections import defaultdict
 from logging import Logger
 from typing import Optional, Tuple, Any
 
 import yaml
+
+try:
+    # libyaml-backed parser, much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from netunicorn.base.architecture import Architecture
 from netunicorn.base.deployment import Deployment
 from netunicorn.base.environment_definitions import DockerImage, ShellExecution
@@ -17,6 +28,94 @@ from netunicorn.director.base.connectors.protocol import (
 )
 from netunicorn.director.base.connectors.types import StopExecutorRequest
 
+from .batching import AsyncBatcher
+
+# the full per-call scope travels with every batched item so a bulk flush
+# can issue one authenticated backend request per (username, experiment_id)
+# instead of mixing unrelated callers into a single call
+_DeployItem = Tuple[
+    Deployment, str, str, Optional[dict[str, str]], Optional[dict[str, str]]
+]
+_ExecuteItem = Tuple[
+    Deployment, str, str, Optional[dict[str, str]], Optional[dict[str, str]]
+]
+_StopItem = Tuple[
+    StopExecutorRequest, str, Optional[dict[str, str]], Optional[dict[str, str]]
+]
+
+# Result containers are immutable, so constant outcomes are shared instead
+# of being allocated once per deployment
+_SUCCESS_DEPLOYED = Success("success message")
+_SUCCESS_NONE = Success(None)
+_FAILURE_SKIPPED = Failure("skipped")
+_FAILURE_NOT_DOCKER = Failure("not a docker image")
+
+# bound once at import: the command shape is fixed, so reuse one compiled
+# format instead of re-parsing several f-strings per deployment
+_RUN_COMMAND = (
+    "docker run -d -p {ports} {gateway} "
+    "-e NETUNICORN_EXECUTOR_ID={executor_id} "
+    "-e NETUNICORN_EXPERIMENT_ID={experiment_id} "
+    "{environment}--name {executor_id} {image}"
+).format_map
+
+# example nodes all share this one properties dict (treat it as read-only),
+# so large pools don't pay one allocation per node just to be serialized out;
+# a MappingProxyType would enforce immutability but the JSON encoders cannot
+# serialize mapping proxies
+_NODE_PROPERTIES = {"cpu": 4, "memory": 16, "gpu": 0}
+
+# memoizes parsed configuration files across connector instantiations,
+# keyed by (absolute path, mtime in ns, size) so edits invalidate the entry
+_YAML_CACHE: dict[tuple[str, int, int], Any] = {}
+
+
+def _parse_configuration_file(path: str) -> Any:
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key in _YAML_CACHE:
+        return _YAML_CACHE[key]
+
+    # prefer the JSON sidecar written by a previous start: JSON parsing is
+    # an order of magnitude faster than YAML
+    cache_path = path + ".cache.json"
+    parsed = None
+    if (
+        os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) >= stat.st_mtime
+    ):
+        try:
+            with open(cache_path, "rb") as f:
+                parsed = json.loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            parsed = None
+
+    if parsed is None:
+        with open(path) as f:
+            parsed = yaml.load(f, Loader=_YamlLoader)
+        # the cache is best-effort: skip it on read-only filesystems and for
+        # configs that are not JSON-representable (dates, non-string keys);
+        # note that configs loaded from the sidecar get JSON semantics, so
+        # e.g. YAML timestamps stay strings -- keep configs JSON-compatible
+        # if you rely on this cache
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(parsed).encode())
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    _YAML_CACHE[key] = parsed
+    return parsed
+
+
+def _load_configuration(configuration: str | None) -> Any:
+    # decide on path vs. inline JSON once, not both
+    if configuration is not None and os.path.exists(configuration):
+        return _parse_configuration_file(configuration)
+    return json.loads(configuration) if configuration else None
+
 
 class ConnectorTemplate(NetunicornConnectorProtocol):
     """
@@ -34,13 +133,11 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         # just store it
         self.connector_name = connector_name
 
-        # connector-specific configuration
-        self.configuration = configuration
-        # for example, you can wait for a filename or JSON to be parsed
-        with open(self.configuration) as f:
-            self.configuration = yaml.safe_load(f)
-        # or
-        self.configuration = json.loads(self.configuration)
+        # connector-specific configuration: a path to a YAML file or an
+        # inline JSON string; parsed lazily in initialize() so construction
+        # never blocks the event loop on file I/O
+        self._raw_configuration = configuration
+        self.configuration: Any = None
 
         # default netunicorn gateway address
         # should be provided as environment variable NETUNICORN_GATEWAY_ENDPOINT to the executor
@@ -49,10 +146,44 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         # optional logging.Logger instance
         self.logger = logger or logging.getLogger(__name__)
 
+        # bounds the number of concurrent backend calls issued by the
+        # per-deployment helpers below
+        self._backend_semaphore = asyncio.Semaphore(32)
+
+        # micro-batching queues: per-item calls arriving within a few ms
+        # (e.g. from concurrent HTTP requests) are coalesced into one bulk
+        # backend request each
+        self._deploy_batcher: AsyncBatcher[
+            _DeployItem, Result[Optional[str], str]
+        ] = AsyncBatcher(flush=self._bulk_deploy, max_wait_ms=5, max_size=64)
+        self._execute_batcher: AsyncBatcher[
+            _ExecuteItem, Result[Optional[str], str]
+        ] = AsyncBatcher(flush=self._bulk_execute, max_wait_ms=5, max_size=64)
+        self._stop_batcher: AsyncBatcher[
+            _StopItem, Result[Optional[str], str]
+        ] = AsyncBatcher(flush=self._bulk_stop, max_wait_ms=5, max_size=64)
+
+        # per-user cache of get_nodes results, so pod fleets hammering
+        # /nodes don't translate into one infrastructure call per request;
+        # TTL (seconds) is configurable via the "nodes_cache_ttl" key
+        self._nodes_cache_ttl = 30.0
+        self._nodes_cache: dict[str, tuple[float, Nodes]] = {}
+        self._nodes_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
     async def initialize(self, *args: Any, **kwargs: Any) -> None:
         # initialize the connector
         # for example, create async http client to rest api or similar instantiation
-        pass
+
+        # the blocking part of the configuration load (stat, sidecar cache,
+        # YAML parse) runs in a worker thread so the event loop can already
+        # serve /health while it completes
+        self.configuration = await asyncio.to_thread(
+            _load_configuration, self._raw_configuration
+        )
+        if isinstance(self.configuration, dict):
+            self._nodes_cache_ttl = float(
+                self.configuration.get("nodes_cache_ttl", self._nodes_cache_ttl)
+            )
 
     async def health(self, *args: Any, **kwargs: Any) -> Tuple[bool, str]:
         # implement internal checks if connector is healthy
@@ -76,13 +207,34 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         # otherwise, return CountableNodePool object with list of nodes
         # you can require users to provide any additional information in authentication_context
         # e.g., private tokens or API keys
+        entry = self._nodes_cache.get(username)
+        if entry is not None and time.monotonic() - entry[0] < self._nodes_cache_ttl:
+            return entry[1]
+
+        # the per-user lock coalesces concurrent cache misses into a single
+        # upstream fetch
+        async with self._nodes_cache_locks[username]:
+            entry = self._nodes_cache.get(username)
+            if (
+                entry is not None
+                and time.monotonic() - entry[0] < self._nodes_cache_ttl
+            ):
+                return entry[1]
+            nodes = await self._fetch_nodes(username, authentication_context)
+            self._nodes_cache[username] = (time.monotonic(), nodes)
+            return nodes
 
+    async def _fetch_nodes(
+        self,
+        username: str,
+        authentication_context: Optional[dict[str, str]] = None,
+    ) -> Nodes:
         # example for a real infrastructure with 3 nodes:
         return CountableNodePool(
             [
                 Node(
                     name=f"node-{i}",
-                    properties={"cpu": 4, "memory": 16, "gpu": 0},
+                    properties=_NODE_PROPERTIES,
                     architecture=Architecture.LINUX_AMD64,
                 )
                 for i in range(3)
@@ -127,18 +279,80 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         #   and ensure that netunicorn-executor is installed
         # for each deployment, you should return a Result[optional success message, error message]
         # combined them together in a dictionary of deployment.executor_id -> Result
-        for deployment in deployments:
-            print(deployment.executor_id)
-            if isinstance(deployment.environment_definition, DockerImage):
-                # pull docker image
-                print(deployment.environment_definition.image)
-            elif isinstance(deployment.environment_definition, ShellExecution):
-                print(deployment.environment_definition.commands)
+        # backend calls are issued concurrently (bounded by the semaphore)
+        # instead of paying one round trip per deployment
+        results = await asyncio.gather(
+            *(
+                self._deploy_one(
+                    deployment,
+                    username,
+                    experiment_id,
+                    deployment_context,
+                    authentication_context,
+                )
+                for deployment in deployments
+            ),
+            return_exceptions=True,
+        )
         return {
-            deployment.executor_id: Success("success message")
-            for deployment in deployments
+            deployment.executor_id: (
+                Failure(str(result)) if isinstance(result, BaseException) else result
+            )
+            for deployment, result in zip(deployments, results)
         }
-        pass
+
+    async def _deploy_one(
+        self,
+        deployment: Deployment,
+        username: str,
+        experiment_id: str,
+        deployment_context: Optional[dict[str, str]],
+        authentication_context: Optional[dict[str, str]],
+    ) -> Result[Optional[str], str]:
+        return await self._deploy_batcher.submit(
+            (
+                deployment,
+                username,
+                experiment_id,
+                deployment_context,
+                authentication_context,
+            )
+        )
+
+    async def _bulk_deploy(
+        self, items: list[_DeployItem]
+    ) -> list[Result[Optional[str], str]]:
+        # group by caller scope: a real implementation would issue one
+        # authenticated bulk backend request per (username, experiment_id),
+        # using the contexts carried by the grouped items
+        scopes: dict[tuple[str, str], list[Deployment]] = {}
+        for deployment, username, experiment_id, _, _ in items:
+            scopes.setdefault((username, experiment_id), []).append(deployment)
+        buffer: list[str] = []
+        async with self._backend_semaphore:
+            for (username, experiment_id), deployments in scopes.items():
+                # partition by environment type once so each loop below is
+                # monomorphic instead of re-dispatching on isinstance per item
+                docker_deployments = [
+                    d
+                    for d in deployments
+                    if isinstance(d.environment_definition, DockerImage)
+                ]
+                shell_deployments = [
+                    d
+                    for d in deployments
+                    if isinstance(d.environment_definition, ShellExecution)
+                ]
+                for deployment in deployments:
+                    buffer.append(deployment.executor_id)
+                for deployment in docker_deployments:
+                    # pull docker image
+                    buffer.append(deployment.environment_definition.image)
+                for deployment in shell_deployments:
+                    buffer.append(str(deployment.environment_definition.commands))
+            if buffer and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("\n".join(buffer))
+            return [_SUCCESS_DEPLOYED] * len(items)
 
     async def execute(
         self,
@@ -162,28 +376,88 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         # you don't need to deploy failed deployments but can examine them as well
 
         # example with docker containers
-        result = {}
-        for deployment in deployments:
-            if not deployment.prepared:
-                result[deployment.executor_id] = Failure("skipped")
-            if not isinstance(deployment.environment_definition, DockerImage):
-                result[deployment.executor_id] = Failure("not a docker image")
-
-            assert deployment.node.name == "local"
-            print(
-                f"docker run -d -p {deployment.environment_definition.runtime_context.ports_mapping} "
-                f"-e NETUNICORN_GATEWAY_ENDPOINT={self.netunicorn_gateway} "
-                f"-e NETUNICORN_EXECUTOR_ID={deployment.executor_id} "
-                f"-e NETUNICORN_EXPERIMENT_ID={experiment_id} "
-                " -e ".join(
-                    f"{x}={y}"
-                    for x, y in deployment.environment_definition.runtime_context.environment_variables.items()
-                ),
-                f" --name {deployment.executor_id}"
-                f" {deployment.environment_definition.image}",
+        results = await asyncio.gather(
+            *(
+                self._execute_one(
+                    deployment,
+                    username,
+                    experiment_id,
+                    execution_context,
+                    authentication_context,
+                )
+                for deployment in deployments
+            ),
+            return_exceptions=True,
+        )
+        return {
+            deployment.executor_id: (
+                Failure(str(result)) if isinstance(result, BaseException) else result
+            )
+            for deployment, result in zip(deployments, results)
+        }
+
+    async def _execute_one(
+        self,
+        deployment: Deployment,
+        username: str,
+        experiment_id: str,
+        execution_context: Optional[dict[str, str]],
+        authentication_context: Optional[dict[str, str]],
+    ) -> Result[Optional[str], str]:
+        if not deployment.prepared:
+            return _FAILURE_SKIPPED
+        if not isinstance(deployment.environment_definition, DockerImage):
+            return _FAILURE_NOT_DOCKER
+        return await self._execute_batcher.submit(
+            (
+                deployment,
+                username,
+                experiment_id,
+                execution_context,
+                authentication_context,
             )
-            result[deployment.executor_id] = Success(None)
-        return result
+        )
+
+    async def _bulk_execute(
+        self, items: list[_ExecuteItem]
+    ) -> list[Result[Optional[str], str]]:
+        # the gateway flag is identical for every deployment, so format it once
+        gateway = f"-e NETUNICORN_GATEWAY_ENDPOINT={self.netunicorn_gateway}"
+        commands = []
+        results: list[Result[Optional[str], str]] = []
+        async with self._backend_semaphore:
+            # a real implementation would group items by
+            # (username, experiment_id) here and issue one authenticated
+            # bulk request per scope, using the contexts carried per item
+            for deployment, username, experiment_id, _, _ in items:
+                # reject unsupported nodes individually so one bad item
+                # doesn't condemn the whole batch
+                if deployment.node.name != "local":
+                    results.append(
+                        Failure(f"unsupported node: {deployment.node.name}")
+                    )
+                    continue
+                results.append(_SUCCESS_NONE)
+                runtime_context = deployment.environment_definition.runtime_context
+                commands.append(
+                    _RUN_COMMAND(
+                        {
+                            "ports": runtime_context.ports_mapping,
+                            "gateway": gateway,
+                            "executor_id": deployment.executor_id,
+                            "experiment_id": experiment_id,
+                            "environment": "".join(
+                                f"-e {x}={y} "
+                                for x, y in runtime_context.environment_variables.items()
+                            ),
+                            "image": deployment.environment_definition.image,
+                        }
+                    )
+                )
+            # one buffered emit instead of one print (and flush) per command
+            if commands and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("\n".join(commands))
+            return results
 
     async def stop_executors(
         self,
@@ -197,16 +471,56 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
         # cancel executors on the infrastructure
         # user can provide additional context via cancellation_context and authentication_context
         # e.g.:
-        print(cancellation_context.get("reason"))
+        if cancellation_context:
+            self.logger.debug(cancellation_context.get("reason"))
 
         # example for docker infrastructure
-        result = {}
-        for request in requests_list:
-            assert request["node_name"] == "local"
-            print(f"docker stop {request['executor_id']}")
-            result[request["executor_id"]] = Success(None)
+        results = await asyncio.gather(
+            *(
+                self._stop_one(
+                    request, username, cancellation_context, authentication_context
+                )
+                for request in requests_list
+            ),
+            return_exceptions=True,
+        )
+        return {
+            request["executor_id"]: (
+                Failure(str(result)) if isinstance(result, BaseException) else result
+            )
+            for request, result in zip(requests_list, results)
+        }
 
-        return result
+    async def _stop_one(
+        self,
+        request: StopExecutorRequest,
+        username: str,
+        cancellation_context: Optional[dict[str, str]],
+        authentication_context: Optional[dict[str, str]],
+    ) -> Result[Optional[str], str]:
+        return await self._stop_batcher.submit(
+            (request, username, cancellation_context, authentication_context)
+        )
+
+    async def _bulk_stop(
+        self, items: list[_StopItem]
+    ) -> list[Result[Optional[str], str]]:
+        async with self._backend_semaphore:
+            # a real implementation would group items by username here and
+            # issue one authenticated bulk request per user
+            commands = []
+            results: list[Result[Optional[str], str]] = []
+            for request, *_ in items:
+                if request["node_name"] != "local":
+                    results.append(
+                        Failure(f"unsupported node: {request['node_name']}")
+                    )
+                    continue
+                commands.append(f"docker stop {request['executor_id']}")
+                results.append(_SUCCESS_NONE)
+            if commands and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("\n".join(commands))
+            return results
 
     async def cleanup(
         self,
@@ -217,10 +531,16 @@ class ConnectorTemplate(NetunicornConnectorProtocol):
     ) -> None:
         # cleanup infrastructure after experiment is finished
         # example for docker infrastructure
-        for deployment in deployments:
-            # remove container
-            print(f"docker rm {deployment.executor_id}")
+        await asyncio.gather(
+            *(self._cleanup_one(deployment) for deployment in deployments),
+            return_exceptions=True,
+        )
 
-            # remove image
-            print(f"docker rmi {deployment.environment_definition.image}")
-        pass
+    async def _cleanup_one(self, deployment: Deployment) -> None:
+        async with self._backend_semaphore:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    # remove container, then remove image
+                    f"docker rm {deployment.executor_id}\n"
+                    f"docker rmi {deployment.environment_definition.image}"
+                )
@@ -1,9 +1,24 @@
-import json
+import asyncio
+import hmac
 import os
-from typing import Dict, List, Literal, Optional, TypeAlias, TypedDict, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    TypeAlias,
+    TypedDict,
+    Union,
+)
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Header, HTTPException, Request, Depends, status, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from netunicorn.base.deployment import Deployment
@@ -15,6 +30,32 @@ from .connector import ConnectorTemplate
 
 OperationContext: TypeAlias = Optional[str]
 
+# orjson handles netunicorn types through the same fallback UnicornEncoder uses
+_unicorn_default = UnicornEncoder().default
+
+
+class UnicornJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_unicorn_default)
+
+
+# decoded once from the raw body instead of one FastAPI validation pass
+# plus one manual loop; deliberately not validated through
+# DeploymentRepresentation -- its EnvironmentDefinitionRepresentation
+# TypedDict strips keys like DockerImage's "image"/"build_context", which
+# Deployment.from_json needs to reconstruct the environment
+async def parse_deployments(request: Request) -> List[Deployment]:
+    try:
+        parsed = orjson.loads(await request.body())
+        return [Deployment.from_json(x) for x in parsed]
+    except (KeyError, TypeError, ValueError) as e:
+        # covers orjson.JSONDecodeError (a ValueError) plus the errors
+        # Deployment.from_json raises on schema-valid but malformed items
+        raise HTTPException(
+            status_code=400,
+            detail=f"Couldn't parse the deployments: {e}",
+        )
+
 
 class StopExecutorRequest(TypedDict):
     executor_id: str
@@ -30,9 +71,15 @@ API_KEY = os.environ["NETUNICORN_API_KEY"]
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=4096)
+def _token_is_valid(token: str) -> bool:
+    # constant-time comparison; the outcome is memoized per token so the
+    # check is a dict lookup for well-behaved clients
+    return hmac.compare_digest(token, API_KEY)
+
+
 async def has_access(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
-    if token != API_KEY:
+    if not _token_is_valid(credentials.credentials):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Forbidden"
@@ -41,7 +88,8 @@ async def has_access(credentials: HTTPAuthorizationCredentials = Depends(securit
 
 PROTECTED = [Depends(has_access)]
 app = FastAPI(
-    dependencies=PROTECTED
+    dependencies=PROTECTED,
+    default_response_class=UnicornJSONResponse,
 )
 
 connector = ConnectorTemplate(
@@ -68,24 +116,39 @@ class NodesRepresentation(BaseModel):
     node_pool_data: List[Union[NodeRepresentation, "NodesRepresentation"]]
 
 
+# clients typically resend identical context headers across a batch of
+# requests, so the parse is memoized on the header string; the bounded size
+# keeps adversarial inputs from growing the cache without limit
+@lru_cache(maxsize=1024)
+def _parse_context_cached(json_str: str) -> dict[str, str]:
+    return orjson.loads(json_str)  # type: ignore
+
+
 async def parse_context(json_str: Optional[str]) -> Optional[dict[str, str]]:
     if not json_str or json_str == "null":
         return None
     try:
-        return json.loads(json_str)  # type: ignore
-    except json.JSONDecodeError as e:
+        parsed = _parse_context_cached(json_str)
+    except orjson.JSONDecodeError as e:
         raise HTTPException(
             status_code=400,
             detail=f"Couldn't parse the context: {e}",
         )
+    if not isinstance(parsed, dict):
+        # valid JSON but not an object (e.g. a number or list)
+        raise HTTPException(
+            status_code=400,
+            detail="Couldn't parse the context: expected a JSON object",
+        )
+    # hand out a copy: the cached dict must not be mutated downstream
+    return dict(parsed)
 
 
 @app.post("/initialize", status_code=204)
 async def init(request: Request) -> None:
-    body = await request.body()
-    body = body.decode("utf-8") or "{}"
+    body = await request.body() or b"{}"
     try:
-        await connector.initialize(**json.loads(body))
+        await connector.initialize(**orjson.loads(body))
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -110,29 +173,79 @@ async def shutdown() -> None:
     await connector.shutdown()
 
 
+# concurrent /nodes requests for the same user share one in-flight
+# connector.get_nodes call instead of each going upstream
+_nodes_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+_NO_NODES = object()
+
+
+def _stream_nodes_response(node_pool: Any) -> StreamingResponse:
+    # serialize node by node so the response starts shipping before the
+    # whole pool is rendered into one contiguous string; everything up to
+    # and including the first node is rendered eagerly, so serialization
+    # errors still surface as an error response instead of a truncated 200
+    representation = _unicorn_default(node_pool)
+    nodes = iter(representation.pop("node_pool_data"))
+    # keep all remaining keys of the representation (node_pool_type,
+    # node_pool_metadata, ...) exactly as the encoder emits them
+    head = orjson.dumps(representation, default=_unicorn_default)
+    prefix = (
+        head[:-1]
+        + (b"," if len(head) > 2 else b"")
+        + b'"node_pool_data":['
+    )
+    first = next(nodes, _NO_NODES)
+    if first is not _NO_NODES:
+        prefix += orjson.dumps(first, default=_unicorn_default)
+    return StreamingResponse(
+        _iter_nodes_json(prefix, nodes), media_type="application/json"
+    )
+
+
+async def _iter_nodes_json(head: bytes, nodes: Iterator[Any]) -> AsyncIterator[bytes]:
+    yield head
+    for node in nodes:
+        yield b"," + orjson.dumps(node, default=_unicorn_default)
+    yield b"]}"
+
+
 @app.get("/nodes/{username}", status_code=200)
 async def get_nodes(
         username: str,
         netunicorn_auth_context: OperationContext = Header(default=None),
 ) -> NodesRepresentation:
     auth_context = await parse_context(netunicorn_auth_context)
-    node_pool = await connector.get_nodes(username, auth_context)
-    json_str = json.dumps(node_pool, cls=UnicornEncoder)
-    print(json_str)
-    return Response(media_type="application/json", content=json_str)  # type: ignore
+    inflight = _nodes_inflight.get(username)
+    if inflight is not None:
+        node_pool = await inflight
+    else:
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        _nodes_inflight[username] = future
+        try:
+            node_pool = await connector.get_nodes(username, auth_context)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(node_pool)
+        finally:
+            del _nodes_inflight[username]
+    return _stream_nodes_response(node_pool)  # type: ignore
 
 
 @app.post("/deploy/{username}/{experiment_id}", status_code=200)
 async def deploy(
         username: str,
         experiment_id: str,
-        deployments_data: List[Dict],
+        request: Request,
         netunicorn_auth_context: OperationContext = Header(default=None),
         netunicorn_deployment_context: OperationContext = Header(default=None),
 ) -> Dict[str, ResultData]:
     auth_context = await parse_context(netunicorn_auth_context)
     deployment_context = await parse_context(netunicorn_deployment_context)
-    deployments = [Deployment.from_json(x) for x in deployments_data]
+    deployments = await parse_deployments(request)
 
     result = await connector.deploy(
         username=username,
@@ -142,21 +255,20 @@ async def deploy(
         authentication_context=auth_context,
     )
 
-    json_str = json.dumps(result, cls=UnicornEncoder)
-    return Response(media_type="application/json", content=json_str)  # type: ignore
+    return UnicornJSONResponse(result)  # type: ignore
 
 
 @app.post("/execute/{username}/{experiment_id}", status_code=200)
 async def execute(
         username: str,
         experiment_id: str,
-        deployments_data: List[Dict],
+        request: Request,
         netunicorn_auth_context: OperationContext = Header(default=None),
         netunicorn_execution_context: OperationContext = Header(default=None),
 ) -> Dict[str, ResultData]:
     auth_context = await parse_context(netunicorn_auth_context)
     execution_context = await parse_context(netunicorn_execution_context)
-    deployments = [Deployment.from_json(x) for x in deployments_data]
+    deployments = await parse_deployments(request)
 
     result = await connector.execute(
         username=username,
@@ -166,8 +278,7 @@ async def execute(
         authentication_context=auth_context,
     )
 
-    json_str = json.dumps(result, cls=UnicornEncoder)
-    return Response(media_type="application/json", content=json_str)  # type: ignore
+    return UnicornJSONResponse(result)  # type: ignore
 
 
 @app.post("/stop_executors/{username}", status_code=200)
@@ -185,17 +296,22 @@ async def stop_executors(
         cancellation_context=cancellation_context,
         authentication_context=auth_context,
     )
-    json_str = json.dumps(result, cls=UnicornEncoder)
-    return Response(media_type="application/json", content=json_str)  # type: ignore
+    return UnicornJSONResponse(result)  # type: ignore
 
 
 @app.post("/cleanup/{experiment_id}", status_code=200)
 async def cleanup(
         experiment_id: str,
-        deployments_data: List[Dict],
+        request: Request,
 ) -> None:
-    deployments = [Deployment.from_json(x) for x in deployments_data]
+    deployments = await parse_deployments(request)
     await connector.cleanup(experiment_id, deployments)
 
 if __name__ == '__main__':
-    uvicorn.run(app, host=os.environ.get("UVICORN_HOST", "0.0.0.0"), port=int(os.environ.get("UVICORN_PORT", 8000)))
+    uvicorn.run(
+        app,
+        host=os.environ.get("UVICORN_HOST", "0.0.0.0"),
+        port=int(os.environ.get("UVICORN_PORT", 8000)),
+        loop="uvloop",
+        http="httptools",
+    )